@@ -6,6 +6,7 @@ Module that contains dataclasses related to the conversion process in MakeItParq
 import re
 import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import NamedTuple
 
@@ -76,6 +77,18 @@ class ConversionData:
         arguments: str = getattr(ConversionData.default_argument_mapping, ext_key)
         return arguments
 
+    @staticmethod
+    @lru_cache
+    def _generate_read_attributes(input_ext: str) -> tuple[str, str]:
+        """
+        Returns the read function and default arguments for an input extension.
+        Cached, as every file in a conversion shares the same input extension.
+        """
+        ext_key: str = ConversionData._generate_ext_key(input_ext)
+        read_function: str = ConversionData._generate_read_function(ext_key)
+        default_arguments: str = ConversionData._generate_default_arguments(ext_key)
+        return read_function, default_arguments
+
     @staticmethod
     def generate_export_attributes(
         file_info: FileInfo, input_ext: str, output_ext: str
@@ -188,10 +201,10 @@ class ConversionData:
     def __init__(self, input_ext: str, file_path: Path) -> None:
         """Initializes a ConversionData instance."""
 
-        # Normalize the extension: remove a leading dot.
-        ext_key: str = ConversionData._generate_ext_key(input_ext)
-        read_function: str = ConversionData._generate_read_function(ext_key)
-        default_arguments: str = ConversionData._generate_default_arguments(ext_key)
+        # Read function and arguments for the extension (computed once per extension).
+        read_function, default_arguments = ConversionData._generate_read_attributes(
+            input_ext
+        )
         table_name = self._create_unique_table_name(file_path)
         import_query = self.generate_import_query(
             table_name, file_path, read_function, default_arguments
@@ -3,35 +3,51 @@
 
 import os
 import tempfile
-import time
+import threading
 import uuid
-from queue import Queue
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 
 import duckdb
 
 from .conversion_data import ConversionData, ExportAttributes
-from .file_information import FileInfo
+from .file_information import FileInfo, prefetch_file
 from .file_manager import DirectoryManager, FileManager
 from .user_interface.prompts import prompt_for_output_extension
 
+# Number of upcoming files to read ahead while the current file is converted.
+PREFETCH_WINDOW: int = 4
+
+# Seconds to wait for the export to be prepared (e.g. the output format prompt) before exiting.
+EXPORT_PREPARATION_TIMEOUT: int = 300
+
+# Number of worker threads converting files concurrently. Capped at the CPU count, as DuckDB already
+# parallelises each query and every in-flight import stages a whole file in the temp database.
+MAX_CONVERSION_WORKERS: int = os.cpu_count() or 1
+
 
 class ConversionManager:
     """Manages the conversion process using a single persistent DuckDB connection.
 
     This class handles file import and export operations following a workflow:
-    - Files are imported one-by-one into uniquely named tables
-    - If output format is not yet specified, imported files are queued
-    - Once output format is set, pending files are processed in order
-    - After clearing the queue, operates in one-in, one-out mode
+    - Until the export is prepared, files are imported one-by-one into uniquely named tables
+      and held as pending exports
+    - Once the export is prepared, pending files are exported concurrently, in no fixed order,
+      alongside the remaining files, which are converted in one-in, one-out mode
+    - Every export and conversion runs on a worker with its own cursor
 
     Attributes:
         db_path: Path to the DuckDB database file
         conn: Active DuckDB connection
         output_ext: File extension for exported files
         settings: Application settings object
-        import_queue: Queue of files to be imported
+        import_queue: Files to be imported, only consumed on the thread running run_conversion
         pending_exports: Files imported but not yet exported
-        one_in_one_out: Whether to export immediately after import
+        conversion_errors: Files that failed to convert, with the error raised
+        started_imports: Number of imports started, which the read-ahead window follows
+        prefetched_files: Number of files from the conversion list read ahead so far
+        prefetch_lock: Guards started_imports and prefetched_files across workers
     """
 
     def __init__(self, file_manager: FileManager | DirectoryManager) -> None:
@@ -42,15 +58,18 @@ class ConversionManager:
                 and file list information
         """
         self.file_manager: FileManager | DirectoryManager = file_manager
-        self.file_info: FileInfo = self.file_manager.settings.file_info
+        self.file_info: FileInfo = file_manager.settings.file_info
         self.export_attributes: ExportAttributes
         self.db_path: str = os.path.join(
             tempfile.gettempdir(), f"make_it_parquet_{uuid.uuid4()}.db"
         )
         self.conn: duckdb.DuckDBPyConnection = duckdb.connect(database=self.db_path)  # pyright: ignore[reportUnknownMemberType]
-        self.import_queue: Queue[FileInfo] = Queue()
+        self.import_queue: deque[FileInfo] = deque()
         self.pending_exports: list[ConversionData] = []
-        self.one_in_one_out: bool = self.output_ext is not None
+        self.conversion_errors: list[tuple[Path, duckdb.Error]] = []
+        self.started_imports: int = 0
+        self.prefetched_files: int = 0
+        self.prefetch_lock: threading.Lock = threading.Lock()
 
         self._populate_import_queue(file_manager.conversion_file_list)
 
@@ -64,69 +83,148 @@ class ConversionManager:
         Args:
             conversion_file_list: List of file dictionaries containing paths
         """
-        for file_info in conversion_file_list:
-            self.import_queue.put(file_info)
+        self.import_queue.extend(conversion_file_list)
 
-    def run_conversion(self) -> None:
+    def run_conversion(
+        self, executor: ThreadPoolExecutor, prepare_export: Future[bool]
+    ) -> bool:
         """Processes files from the import queue.
 
         Workflow:
-        1. If output_ext is not set, files are imported and held in pending_exports
-        2. Once output_ext is set, pending files are processed in order
-        3. After that, switches to immediate import-export mode
-        """
-        # Start import process
-        while not self.import_queue.empty():
-            # import file and store returned data.
-            conversion_data = self._import_file()
+        1. Until the export is prepared, files are imported and held in pending_exports
+        2. Once prepare_export completes, pending files are exported concurrently on the executor
+        3. Alongside them, the remaining files are converted concurrently on the executor
 
-            # Check for output_ext, if none keep importing files
-            # If output_ext provided export all tables, and switch to one in one out.
-            if not self.one_in_one_out:
-                # add last file to pending_exports
-                self.pending_exports.append(conversion_data)
-                # If output extension is now set, process all pending files
-                if self.output_ext:
-                    self._process_pending_exports()
-                    self.one_in_one_out = True
+        Args:
+            executor: Executor the remaining files are submitted to for conversion
+            prepare_export: Future for prepare_for_export, submitted to the executor
 
-            # In one-in, one-out mode; export immediately after import
-            else:
-                self._export_file(conversion_data)
-
-            # releasses process to check queue again.
-            self.import_queue.task_done()
-
-        if self.pending_exports:
-            start_time = time.time()
-            while True:
-                if self.output_ext:
-                    break
-                if time.time() - start_time > 300:
-                    self.close_connection(True)
-                    self.file_manager.settings.exit_program(
-                        "No input for 5 minutes. Exiting program."
-                    )
-                time.sleep(0.01)
-                continue
-            self._process_pending_exports()
+        Returns:
+            True if every file was converted
+        """
+        self._import_until_export_ready(prepare_export)
+        self._wait_for_export_preparation(prepare_export)
+        conversions = self._process_pending_exports(executor)
+        conversions.extend(self._convert_remaining_files(executor))
+        for conversion in conversions:
+            conversion.result()
+
+        self._log_conversion_errors()
         # Shut down connection and clean up temp files.
         self.close_connection(True)
+        return not self.conversion_errors
+
+    def _import_until_export_ready(self, prepare_export: Future[bool]) -> None:
+        """Imports files into pending_exports while the export is not yet prepared."""
+        while not prepare_export.done() and self.import_queue:
+            # import file and store returned data.
+            file_info = self.import_queue.popleft()
+            try:
+                conversion_data = self._import_file(file_info, self.conn)
+            except duckdb.Error as error:
+                self.conversion_errors.append((file_info.file_path, error))
+            else:
+                self.pending_exports.append(conversion_data)
+
+    def _wait_for_export_preparation(self, prepare_export: Future[bool]) -> None:
+        """Blocks until the export is prepared, rather than polling the output extension.
+
+        Re-raises any exception raised while preparing, and exits the program if preparation
+        times out after EXPORT_PREPARATION_TIMEOUT seconds or finishes without preparing the export.
+        """
+        try:
+            export_prepared = prepare_export.result(timeout=EXPORT_PREPARATION_TIMEOUT)
+        except TimeoutError:
+            self.close_connection(True)
+            logger = self.file_manager.settings.logger
+            logger.error(
+                "No input for %d seconds. Exiting program.", EXPORT_PREPARATION_TIMEOUT
+            )
+            logger.stop_logging()
+            # The prompt is still blocked reading stdin on its worker, which sys.exit would wait for
+            # while shutting down the pool, so exit the process immediately.
+            os._exit(1)
+        except BaseException:
+            self.close_connection(True)
+            raise
+        if not export_prepared:
+            self.close_connection(True)
+            self.file_manager.settings.exit_program(
+                "Unable to prepare the export.", error_type="error"
+            )
+
+    def _convert_remaining_files(
+        self, executor: ThreadPoolExecutor
+    ) -> list[Future[None]]:
+        """Submits the remaining files for conversion, one-in, one-out on each worker.
+
+        Args:
+            executor: Executor the files are submitted to
 
-    def _import_file(self) -> ConversionData:
-        file_info = self.import_queue.get()
+        Returns:
+            Futures for the submitted conversions
+        """
+        conversions: list[Future[None]] = []
+        while self.import_queue:
+            conversions.append(
+                executor.submit(self.convert_file, self.import_queue.popleft())
+            )
+        return conversions
+
+    def convert_file(self, file_info: FileInfo) -> None:
+        """Imports and exports a single file.
+
+        Uses its own cursor on the shared database, so files can be converted concurrently.
+        """
+        with self.conn.cursor() as cursor:
+            try:
+                conversion_data = self._import_file(file_info, cursor)
+                self._export_file(conversion_data, cursor)
+            except duckdb.Error as error:
+                self.conversion_errors.append((file_info.file_path, error))
+
+    def _prefetch_upcoming_files(self) -> None:
+        """Advances the read-ahead window to cover the next PREFETCH_WINDOW files to be imported.
+
+        Called once before each import, from whichever thread performs it.
+        """
+        conversion_file_list = self.file_manager.conversion_file_list
+        with self.prefetch_lock:
+            window_end = min(
+                self.started_imports + PREFETCH_WINDOW, len(conversion_file_list)
+            )
+            self.started_imports += 1
+            while self.prefetched_files < window_end:
+                prefetch_file(conversion_file_list[self.prefetched_files].file_path)
+                self.prefetched_files += 1
+
+    def _import_file(
+        self, file_info: FileInfo, connection: duckdb.DuckDBPyConnection
+    ) -> ConversionData:
+        # Read ahead the next files while this one is converted.
+        self._prefetch_upcoming_files()
         conversion_data = ConversionData(file_info.file_ext, file_info.file_path)
-        _ = self.conn.execute(conversion_data.import_attributes.import_query)
+        _ = connection.execute(conversion_data.import_attributes.import_query)
         return conversion_data
 
-    def prepare_for_export(self):
+    def prepare_for_export(self) -> bool:
+        """Determines the output extension and creates the output directory.
+
+        Returns:
+            True if the export was prepared
+        """
         self._determine_output_extension()
         if self.output_ext:
             if self.file_manager.input_ext:
                 export_attributes = ConversionData.generate_export_attributes(
                     self.file_info, self.file_manager.input_ext, self.output_ext
                 )
+                export_attributes.output_directory_path.mkdir(
+                    exist_ok=True, parents=True
+                )
                 self.export_attributes = export_attributes
+                return True
+        return False
 
     def _determine_output_extension(self):
         """
@@ -141,40 +239,81 @@ class ConversionManager:
                     self.file_manager.input_ext, self.file_manager.settings
                 )
 
-    def _process_pending_exports(self) -> None:
-        """Processes all pending exports in order."""
-        self.export_attributes.output_directory_path.mkdir(exist_ok=True, parents=True)
-        for conversion_data in self.pending_exports:
-            self._export_file(conversion_data)
-        self.pending_exports.clear()
+    def _process_pending_exports(
+        self, executor: ThreadPoolExecutor
+    ) -> list[Future[None]]:
+        """Submits all pending exports to the executor, taking the whole list at once.
+
+        Args:
+            executor: Executor the exports are submitted to
+
+        Returns:
+            Futures for the submitted exports
+        """
+        pending_exports, self.pending_exports = self.pending_exports, []
+        return [
+            executor.submit(self.export_pending_file, conversion_data)
+            for conversion_data in pending_exports
+        ]
+
+    def export_pending_file(self, conversion_data: ConversionData) -> None:
+        """Exports a file imported before the export was prepared.
 
-    def _export_file(self, conversion_data: ConversionData) -> None:
+        Uses its own cursor on the shared database, so pending files can be exported concurrently.
+        """
+        with self.conn.cursor() as cursor:
+            try:
+                self._export_file(conversion_data, cursor)
+            except duckdb.Error as error:
+                self.conversion_errors.append(
+                    (conversion_data.import_attributes.file_path, error)
+                )
+
+    def _export_file(
+        self, conversion_data: ConversionData, connection: duckdb.DuckDBPyConnection
+    ) -> None:
         """
         Exports a table to a file with the specified output extension.
         Drops table and logs successful conversion.
         """
         # Export table to file.
-        self._export_table(conversion_data)
+        self._export_table(conversion_data, connection)
         # Drop table.
-        self._drop_table(conversion_data)
+        self._drop_table(conversion_data, connection)
         # Log conversion
         self._log_conversion(conversion_data)
 
-    def _export_table(self, conversion_data: ConversionData) -> None:
+    def _export_table(
+        self, conversion_data: ConversionData, connection: duckdb.DuckDBPyConnection
+    ) -> None:
         export_query = conversion_data.generate_export_query(self.export_attributes)
-        _ = self.conn.execute(export_query)
+        _ = connection.execute(export_query)
 
-    def _drop_table(self, conversion_data: ConversionData):
+    def _drop_table(
+        self, conversion_data: ConversionData, connection: duckdb.DuckDBPyConnection
+    ):
         drop_statement: str = conversion_data.import_attributes.table_name
-        _ = self.conn.execute(f"DROP TABLE {drop_statement}")
+        _ = connection.execute(f"DROP TABLE {drop_statement}")
 
     def _log_conversion(self, conversion_data: ConversionData):
         import_file: str = conversion_data.import_attributes.file_path.name
         export_file: str = conversion_data.output_path.name
         self.file_manager.settings.logger.info(
-            f"File {import_file} successfully converted to {export_file}"
+            "File %s successfully converted to %s", import_file, export_file
         )
 
+    def _log_conversion_errors(self) -> None:
+        """Logs every file that failed to convert in a single message."""
+        if self.conversion_errors:
+            self.file_manager.settings.logger.error(
+                "Failed to convert %d file(s):\n%s",
+                len(self.conversion_errors),
+                "\n".join(
+                    f"{file_path.name}: {error}"
+                    for file_path, error in self.conversion_errors
+                ),
+            )
+
     def close_connection(self, cleanup_db_file: bool = False) -> None:
         """Closes the DuckDB connection and optionally removes the DB file.
 
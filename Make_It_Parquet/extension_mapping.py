@@ -1,24 +1,30 @@
 #! /usr/bin/env python3
-
+from collections.abc import Mapping
+from types import MappingProxyType
 
 # Allowed file extensions.
-ALLOWED_FILE_EXTENSIONS: set[str] = {".csv", "tsv", "txt", ".json", ".parquet", ".xlsx"}
+ALLOWED_FILE_EXTENSIONS: frozenset[str] = frozenset(
+    {".csv", ".tsv", ".txt", ".json", ".parquet", ".xlsx"}
+)
 
-# Alias to extension map.
-ALIAS_TO_EXTENSION_MAP: dict[str, str] = {
-    "csv": ".csv",
-    "txt": ".txt",
-    "tsv": ".tsv",
-    "json": ".json",
-    "js": ".json",
-    "parquet": ".parquet",
-    "pq": ".parquet",
-    "excel": ".xlsx",
-    "ex": ".xlsx",
-    "xlsx": ".xlsx",
-}
+# Alias to extension map (read-only).
+ALIAS_TO_EXTENSION_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "csv": ".csv",
+        "txt": ".txt",
+        "tsv": ".tsv",
+        "json": ".json",
+        "js": ".json",
+        "parquet": ".parquet",
+        "pq": ".parquet",
+        "excel": ".xlsx",
+        "ex": ".xlsx",
+        "xlsx": ".xlsx",
+    }
+)
 
-# Reverse the alias to extension map.
-EXTENSION_TO_ALIAS_MAP: dict[str, str] = {
-    v: k for k, v in ALIAS_TO_EXTENSION_MAP.items()
-}
+# Reverse the alias to extension map (read-only), keeping the first (canonical) alias listed for
+# each extension, e.g. ".xlsx" -> "excel" rather than "xlsx".
+EXTENSION_TO_ALIAS_MAP: Mapping[str, str] = MappingProxyType(
+    {v: k for k, v in reversed(ALIAS_TO_EXTENSION_MAP.items())}
+)
@@ -15,30 +15,13 @@ class FileInfo(NamedTuple):
     file_or_directory: str
 
 
-def resolve_path(input: Path | os.DirEntry[str]) -> Path:
-    """Resolves input path."""
-    if isinstance(input, Path):
-        return input.resolve()
-    else:
-        return Path(input.path).resolve()
+# Stands in for the input path's info when none was given, so file_info is always a FileInfo.
+EMPTY_FILE_INFO: FileInfo = FileInfo(Path(), os.stat_result((0,) * 10), "", 0, "", "")
 
 
-def get_file_stat(
-    input: Path | os.DirEntry[str], resolved_path: Path
-) -> os.stat_result:
-    """Creates a file stat of the target file, which can be submitted as a path or an os.DirEntry object.
-
-    Args:
-        input: The target file in the form of a Path or os.DirEntry.
-        resolved_path: Resolved path to be used instead of user entered path if object passed is a path.
-
-    Returns:
-        os.stat_result
-    """
-    if isinstance(input, Path):
-        return resolved_path.stat()
-    else:
-        return input.stat()
+def get_file_extension(file_name: str) -> str:
+    """Returns the lower-cased extension of a file name, including the leading dot."""
+    return os.path.splitext(file_name)[1].lower()
 
 
 def file_or_dir_from_stat(stat_obj: os.stat_result) -> str:
@@ -46,15 +29,59 @@ def file_or_dir_from_stat(stat_obj: os.stat_result) -> str:
     return "file" if stat.S_ISREG(stat_obj.st_mode) else "directory"
 
 
-def create_file_info(input: Path | os.DirEntry[str]) -> FileInfo:
-    """Creates an info dataclass for the given input path."""
-    path = resolve_path(input)
-    stat_obj = get_file_stat(input, path)
+def create_file_info_from_path(
+    input_path: Path, file_extension: str | None = None
+) -> FileInfo:
+    """Creates an info dataclass for a user supplied path, resolving it first."""
+    path = input_path.resolve()
+    return _build_file_info(path, path.stat(), file_extension)
+
+
+def create_file_info_from_direntry(
+    entry: os.DirEntry[str], file_extension: str | None = None
+) -> FileInfo:
+    """Creates an info dataclass for an entry from os.scandir on an already resolved directory."""
+    # DirEntry caches its stat result, so this is at most one syscall per entry.
+    return _build_file_info(Path(entry.path), entry.stat(), file_extension)
+
+
+def _build_file_info(
+    path: Path, stat_obj: os.stat_result, file_extension: str | None
+) -> FileInfo:
+    """Assembles a FileInfo from a resolved path and its stat result.
+
+    Args:
+        path: Resolved path of the target file.
+        stat_obj: Stat result for the target file.
+        file_extension: Extension already parsed by the caller, reused instead of parsing the name again.
+    """
     file_name = path.name
-    file_size = stat_obj.st_size
-    file_extension = path.suffix
-    file_or_directory = file_or_dir_from_stat(stat_obj)
-    file_info = FileInfo(
-        path, stat_obj, file_name, file_size, file_extension, file_or_directory
+    if file_extension is None:
+        file_extension = get_file_extension(file_name)
+    return FileInfo(
+        path,
+        stat_obj,
+        file_name,
+        stat_obj.st_size,
+        file_extension,
+        file_or_dir_from_stat(stat_obj),
     )
-    return file_info
+
+
+def prefetch_file(file_path: Path) -> None:
+    """Advises the OS that a file will be read soon, so it can be read ahead into the page cache.
+
+    Does nothing on platforms without posix_fadvise, or if the file cannot be opened.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -5,6 +5,7 @@ Module for managing file and directory conversions.
 This module provides classes to manage the conversion of files and directories:
 - FileConversionManager: Handles single file conversions
 - DirectoryConversionManager: Handles directory conversions
+- create_file_manager: Chooses the manager for the input path
 
 The managers handle:
 - Validating input/output formats.
@@ -14,12 +15,17 @@ The managers handle:
 """
 
 import os
-from collections import defaultdict
+from collections import Counter, defaultdict
+from operator import attrgetter
 from pathlib import Path
 from typing import override
 
 from .extension_mapping import ALLOWED_FILE_EXTENSIONS
-from .file_information import FileInfo, create_file_info
+from .file_information import (
+    FileInfo,
+    create_file_info_from_direntry,
+    get_file_extension,
+)
 from .user_interface.prompts import prompt_for_input_extension
 from .user_interface.settings import Settings
 
@@ -35,7 +41,7 @@ class FileManager:
         """
         # Attach Settings and input_path
         self.settings: Settings = settings
-        self.input_path: Path = self.settings.file_info.file_path
+        self.input_path: Path = settings.file_info.file_path
 
         # Initialize input_ext and conversion file list
         self.conversion_file_list: list[FileInfo] = []
@@ -69,7 +75,8 @@ class FileManager:
             self.input_ext not in ALLOWED_FILE_EXTENSIONS
         ):  # TODO consider changing to allow re-entering of input extension or checking the input/output flags, and/or performing a manual check on the input type
             self.settings.exit_program(
-                f"Invalid file extension: {self.input_ext}. Allowed: {ALLOWED_FILE_EXTENSIONS}"
+                f"Invalid file extension: {self.input_ext}. Allowed: {', '.join(sorted(ALLOWED_FILE_EXTENSIONS))}",
+                error_type="error",
             )
 
     def _set_conversion_file_list(self):
@@ -92,7 +99,7 @@ class DirectoryManager(FileManager):
 
         # Initialize file group attributes
         self.extension_file_groups: dict[str, list[FileInfo]] = defaultdict(list)
-        self.extension_counts: dict[str, int] = defaultdict(int)
+        self.extension_counts: Counter[str] = Counter()
 
         # get file groups
         self._get_extension_file_groups()
@@ -106,48 +113,41 @@ class DirectoryManager(FileManager):
     def _set_conversion_file_list(self):
         """Set input extension and file list. Also updates flags."""
         if self.input_ext:
-            self.conversion_file_list: list[FileInfo] = self.extension_file_groups[
-                self.input_ext
-            ]
+            self.conversion_file_list: list[FileInfo] = self.extension_file_groups.pop(
+                self.input_ext, []
+            )
+        # Groups for the other extensions are not converted, release their file information.
+        self.extension_file_groups.clear()
         self._order_files_by_size()
 
     def _order_files_by_size(self):
         """
         Sort the file dictionary by file size.
 
-        Orders files from smallest to largest to optimize processing.
+        Orders files from largest to smallest, so the largest files start first and the smaller ones
+        fill in around them, keeping the conversion workers evenly loaded.
         """
-        self.conversion_file_list.sort(
-            key=lambda x: x.file_size,
-            reverse=True,
-        )
+        self.conversion_file_list.sort(key=attrgetter("file_size"), reverse=True)
 
     def _get_extension_file_groups(self):
         """
         Generate information about files in the directory.
         Scans the directory for files matching the allowed extensions and groups them by extension.
+        Entries are filtered by extension before any file information is created, so unsupported
+        files never cost a stat call.
         """
-        info_dicts_list: list[FileInfo] = self._create_list_of_file_info_dicts()
-        self._group_files_by_extension(info_dicts_list)
-        self._exit_if_no_files()
-
-    def _create_list_of_file_info_dicts(self) -> list[FileInfo]:
-        """Create a list of file information dictionaries from the directory."""
-        file_info_list: list[FileInfo] = []
+        allowed_extensions = ALLOWED_FILE_EXTENSIONS
         with os.scandir(self.input_path) as entries:
             for entry in entries:
-                if entry.is_file():
-                    file_info: FileInfo = create_file_info(entry)
-                    file_info_list.append(file_info)
-        return file_info_list
-
-    def _group_files_by_extension(self, info_dicts_list: list[FileInfo]):
-        """Group files by extension and count the number of files for each extension."""
-        for file_info in info_dicts_list:
-            ext: str = file_info.file_ext
-            if ext in ALLOWED_FILE_EXTENSIONS:
+                if not entry.is_file():
+                    continue
+                ext: str = get_file_extension(entry.name)
+                if ext not in allowed_extensions:
+                    continue
+                file_info: FileInfo = create_file_info_from_direntry(entry, ext)
                 self.extension_file_groups[ext].append(file_info)
                 self.extension_counts[ext] += 1
+        self._exit_if_no_files()
 
     def _exit_if_no_files(self):
         """Exit the program if no compatible file types are found."""
@@ -159,29 +159,38 @@ class DirectoryManager(FileManager):
     def _detect_majority_extension(self):
         """determine the majority file extension in the directory."""
 
-        # Create dict with counts of file formats ordered most to least
-        self._sort_extensions_by_count()
+        # Only the two most common extensions are needed to find a clear majority.
+        top_extensions = self.extension_counts.most_common(2)
 
         # If no majority file format then prompt user for input format
-        if self._no_clear_majority_file_format():
+        if len(top_extensions) > 1 and top_extensions[0][1] == top_extensions[1][1]:
+            self.settings.logger.error(  # TODO: check logger level
+                "Ambiguous file types found %s. Please specify which one to convert.",
+                dict(self.extension_counts),
+            )
             prompt_for_input_extension(self.settings)
-        self.settings.detected_input_ext = list(self.extension_counts.keys())[0]
+        else:
+            self.settings.detected_input_ext = top_extensions[0][0]
 
-    def _sort_extensions_by_count(self):
-        """Sort the extensions by the number of files in each group."""
-        self.extension_counts = dict(
-            sorted(
-                self.extension_counts.items(), key=lambda item: item[1], reverse=True
-            )
-        )
-
-    def _no_clear_majority_file_format(self):
-        """Check if there are ambiguous file types and prompt for input if necessary."""
-        if len(self.extension_counts) > 1:
-            top_keys = list(self.extension_counts.keys())
-            if self.extension_counts[top_keys[0]] == self.extension_counts[top_keys[1]]:
-                self.settings.logger.error(  # TODO: check logger level
-                    f"Ambiguous file types found {self.extension_counts}. Please specify which one to convert."
-                )
-                return True
-        return False
+
+# Manager class for each input type, keyed by FileInfo.file_or_directory.
+FILE_MANAGER_CLASSES: dict[str, type[FileManager]] = {
+    "file": FileManager,
+    "directory": DirectoryManager,
+}
+
+
+def create_file_manager(
+    settings: Settings,
+) -> FileManager | DirectoryManager:
+    """
+    Determines the appropriate conversion manager (file or directory) depending on
+    the input provided via the settings object.
+
+    Args:
+        settings (Settings): The application settings and configuration.
+
+    Returns:
+        FileManager or DirectoryManager: Instance corresponding to the target type.
+    """
+    return FILE_MANAGER_CLASSES[settings.file_info.file_or_directory](settings)
@@ -1,14 +1,37 @@
 #! /usr/bin/env python3
 
-import argparse
 import logging
+import os
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from ..extension_mapping import ALIAS_TO_EXTENSION_MAP
+if TYPE_CHECKING:
+    import argparse
 
+from .. import __version__
+from ..extension_mapping import ALIAS_TO_EXTENSION_MAP
 
-@dataclass
+# Options parsed by the fast path, mapped to the CLIArgs field each one sets and the type its value
+# is converted to (matching the parser's `type=`).
+FAST_PATH_OPTIONS: dict[str, tuple[str, type[str] | type[Path]]] = {
+    "-op": ("output_path", Path),
+    "--output_path": ("output_path", Path),
+    "-i": ("input_format", str),
+    "--input_format": ("input_format", str),
+    "-o": ("output_format", str),
+    "--output_format": ("output_format", str),
+    "-es": ("excel_sheet", str),
+    "--excel_sheet": ("excel_sheet", str),
+    "-er": ("excel_range", str),
+    "--excel_range": ("excel_range", str),
+    "--log-level": ("log_level", str),
+}
+
+
+@dataclass(slots=True)
 class CLIArgs:
     """A dataclass to ensure correct typing of command line arguments"""
 
@@ -21,13 +44,48 @@ class CLIArgs:
     log_level: str | None
 
 
-def parse_cli_arguments() -> CLIArgs:
+def parse_cli_arguments(argv: list[str] | None = None) -> CLIArgs:
     """
     Parse command line arguments.
 
+    Args:
+        argv: Arguments to parse, defaulting to sys.argv[1:]. Lets callers in a long-lived process
+            parse a list directly, reusing the cached parser.
+
     Returns:
         argparse.Namespace: Parsed CLI arguments
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Answer `--version` without building the parser, printing what argparse would.
+    if argv == ["--version"]:
+        print(f"{os.path.basename(sys.argv[0])} {__version__}")
+        sys.exit(0)
+
+    # Fast path for invocations using only the input path and value options,
+    # skipping parser construction.
+    fast_path_args = _parse_common_arguments(argv)
+    if fast_path_args:
+        return fast_path_args
+
+    # argparse doesn't apply defaults to attributes the namespace already has, so seed them here.
+    args = CLIArgs(None, None, None, None, None, None, "INFO")
+    # Parse arguments and create argparse.Namespace object (args).
+    return _build_parser().parse_args(argv, namespace=args)
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> "argparse.ArgumentParser":
+    """
+    Build the argument parser, once per process.
+
+    Returns:
+        argparse.ArgumentParser: Parser for the full set of CLI arguments
+    """
+    # Only imported when the full parser is needed.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Make-it-Parquet!: Conversion of data files powered by DuckDB"
     )
@@ -61,42 +119,66 @@ def parse_cli_arguments() -> CLIArgs:
         help="Set the logging level (e.g., DEBUG, INFO, WARNING)",
         default="INFO",
     )
-    args = CLIArgs(None, None, None, None, None, None, None)
-    # Parse arguments and create argparse.Namespace object (args).
-    return parser.parse_args(namespace=args)
+    # Version.
+    _ = parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+    return parser
+
+
+def _parse_common_arguments(argv: list[str]) -> CLIArgs | None:
+    """
+    Parse an input path followed or preceded by any of the FAST_PATH_OPTIONS, without building an
+    ArgumentParser.
+
+    Returns:
+        CLIArgs with argparse's defaults, or None if the arguments need the full parser
+        (help, any other option, or arguments argparse would reject).
+    """
+    args = CLIArgs(None, None, None, None, None, None, "INFO")
+    tokens = iter(argv)
+    for token in tokens:
+        if token in FAST_PATH_OPTIONS:
+            value = next(tokens, None)
+            if value is None or value.startswith("-"):
+                return None
+            field, value_type = FAST_PATH_OPTIONS[token]
+            setattr(args, field, value_type(value))
+        elif token.startswith("-") or args.input_path:
+            return None
+        else:
+            args.input_path = Path(token)
+    return args if args.input_path else None
 
 
 def _check_format_supported(format: str) -> bool:
     """
     Check if a format is supported.
     """
-    if format in ALIAS_TO_EXTENSION_MAP:
-        return True
-    else:
-        logging.warning(f"Received invalid forma: {format}")
-        return False
+    return _map_format_to_extension(format) is not None
 
 
-def _map_format_to_extension(format: str) -> str:
+def _map_format_to_extension(format: str) -> str | None:
     """
-    Map a format to an extension.
+    Map a format to an extension with a single lookup.
+    Logs a warning and returns None if the format is not supported.
     """
-    return ALIAS_TO_EXTENSION_MAP[format]
+    extension = ALIAS_TO_EXTENSION_MAP.get(format)
+    if extension is None:
+        logging.warning("Received invalid format: %s", format)
+    return extension
 
 
 def _validate_format(format: str | None) -> str | None:
     """
-    Validate a format string by checking its existence, support, and then mapping it to an extension.
+    Validate a format string by checking its existence, then mapping it to an extension
+    (None if unsupported).
     """
     # Check if format is provided.
     if not format:
         return None
 
-    # Check if supported
-    if not _check_format_supported(format):
-        return None
-
-    # Map format to extension
+    # Map format to extension, None if not supported.
     return _map_format_to_extension(format)
 
 
@@ -1,31 +1,137 @@
 #! /usr/bin/env python3
+import atexit
 import logging
-import queue
 import sys
-from logging.handlers import QueueHandler, QueueListener
-from typing import TextIO
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import TextIO, override
+
+# Level names accepted for the log level (DEBUG, INFO, WARNING, ...), built once at import.
+LOG_LEVELS: dict[str, int] = logging.getLevelNamesMapping()
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    A formatter that reuses the formatted timestamp for records created within the same second.
+    Only suitable for date formats without sub-second fields.
+    """
+
+    def __init__(self, fmt: str, datefmt: str) -> None:
+        super().__init__(fmt, datefmt=datefmt)
+        # (second, formatted time) stored as one tuple so threads never see a mismatched pair.
+        self.cached_time: tuple[int, str] = (-1, "")
+
+    @override
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        cached_second, cached_time = self.cached_time
+        if second == cached_second:
+            return cached_time
+        formatted_time = super().formatTime(record, datefmt)
+        self.cached_time = (second, formatted_time)
+        return formatted_time
+
+
+class BufferedConsoleHandler(logging.Handler):
+    """
+    A handler that formats records on the logging thread and hands them to a single writer thread,
+    which writes them to the console in batches.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        super().__init__()
+        self.stream: TextIO = stream
+        self.buffer: deque[str] = deque()
+        self.condition: threading.Condition = threading.Condition()
+        self.stopped: bool = False
+        self.writer_thread: threading.Thread = threading.Thread(
+            target=self._write_batches, name="LogWriterThread", daemon=True
+        )
+        self.started: bool = False
+
+    def _ensure_started(self) -> None:
+        """
+        Start the writer thread on first use, so runs that never log don't pay for it.
+        Must be called with the condition held.
+        """
+        if not self.started:
+            self.started = True
+            self.writer_thread.start()
+
+    @override
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Format the record and add it to the buffer, waking the writer thread.
+        Once stopped, records are written directly.
+        """
+        try:
+            message = self.format(record)
+        # Any formatting error is reported through handleError, as logging.StreamHandler does.
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+            return
+        with self.condition:
+            if not self.stopped:
+                self._ensure_started()
+                self.buffer.append(message)
+                self.condition.notify()
+                return
+        self._write([message])
+
+    def _write_batches(self) -> None:
+        """
+        Wait for buffered messages and write everything buffered in one write and flush.
+        Drains the buffer before exiting once stopped.
+        """
+        while True:
+            with self.condition:
+                while not self.buffer and not self.stopped:
+                    _ = self.condition.wait()
+                messages = list(self.buffer)
+                self.buffer.clear()
+                stopped = self.stopped
+            if messages:
+                self._write(messages)
+            if stopped:
+                return
+
+    def _write(self, messages: list[str]) -> None:
+        _ = self.stream.write("\n".join(messages) + "\n")
+        self.stream.flush()
+
+    def stop(self) -> None:
+        """
+        Stop the writer thread once the buffer has been written.
+        """
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+        if self.writer_thread.is_alive():
+            self.writer_thread.join()
 
 
 class Logger(logging.Logger):
     """
-    A logger that can be used to log messages to the console via asynchronous queue based logging.
+    A logger that can be used to log messages to the console via asynchronous buffered logging.
     """
 
     def __init__(self, log_level: str | None) -> None:
         super().__init__("Make-it-Parquet!")
-        self.log_queue: queue.Queue[str] = queue.Queue()
 
         self.default_log_level: int = logging.INFO
         self.active_log_level: int = self._set_logging_level(log_level)
 
         self._configure_logging()
+        # Write out any buffered records during interpreter shutdown, however the program exits.
+        atexit.register(self.stop_logging)
 
     def _set_logging_level(self, log_level: str | None) -> int:
         """Cleans supplied log level and returns verified numeric logging level.
         If None given or value is eroneous returns value of default_log_level."""
         if log_level:
             verified_log_level: str = log_level.strip().upper()
-            return getattr(logging, verified_log_level, self.default_log_level)
+            return LOG_LEVELS.get(verified_log_level, self.default_log_level)
         else:
             return self.default_log_level
 
@@ -33,44 +139,45 @@ class Logger(logging.Logger):
         """
         Configure asynchronous logging system.
 
-        Sets up queue-based logging with console output.
+        Sets up buffered logging with console output. The writer thread is started by the
+        handler when the first record is emitted.
         """
         self.setLevel(self.active_log_level)
-        self.console_handler: logging.StreamHandler[TextIO] = (
-            self._setup_console_handler()
-        )
-        self.queue_handler: QueueHandler = self._setup_queue_handler()
-        self.queue_listener: QueueListener = self._setup_queue_listener()
-        self.queue_listener.start()
+        self.console_handler: logging.Handler = self._setup_console_handler()
 
-    def _setup_console_handler(self):
+    def _setup_console_handler(self) -> logging.Handler:
         """
         Setup console handler.
+
+        Above INFO only a handful of records are logged per run, so they are written directly
+        rather than through a writer thread.
         """
-        console_handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter("%(asctime)s - %(message)s", datefmt="%H:%M:%S")
+        if self.active_log_level <= logging.INFO:
+            console_handler = BufferedConsoleHandler(sys.stdout)
+        else:
+            console_handler = logging.StreamHandler(sys.stdout)
+        formatter = CachedTimeFormatter("%(asctime)s - %(message)s", datefmt="%H:%M:%S")
         console_handler.setFormatter(formatter)
+        self.addHandler(console_handler)
         return console_handler
 
-    def _setup_queue_handler(self):
-        """
-        Setup queue handler.
-        """
-        queue_handler = QueueHandler(self.log_queue)
-        self.addHandler(queue_handler)
-        return queue_handler
-
-    def _setup_queue_listener(self):
-        """
-        Setup queue listener.
-        """
-        queue_listener = QueueListener(self.log_queue, self.console_handler)
-        return queue_listener
-
     def stop_logging(self):
         """
         Stop the logging system cleanly.
 
-        Ensures logging queue is processed before shutdown.
+        Ensures buffered messages are written before shutdown.
         """
-        self.queue_listener.stop()
+        if isinstance(self.console_handler, BufferedConsoleHandler):
+            self.console_handler.stop()
+        else:
+            self.console_handler.flush()
+
+
+@lru_cache(maxsize=1)
+def get_logger(log_level: str | None) -> Logger:
+    """
+    Return the application logger, creating it on first use.
+
+    Repeated calls with the same log level share one logger and writer thread.
+    """
+    return Logger(log_level)
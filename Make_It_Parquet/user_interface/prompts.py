@@ -28,16 +28,19 @@ def prompt_for_output_extension(input_ext: str, settings: Settings):
 
 
 def _get_extension() -> str:
+    """Prompt until a supported format is entered and return its extension."""
     while True:
         # Prompt for output format.
         output_format = _prompt_user_for_format()
 
         # Validate user input.
         ## If format is valid, return extension.
-        output_ext = _check_format_return_extension(output_format)
-        if not output_ext:
-            continue
-        return output_ext
+        output_ext = ALIAS_TO_EXTENSION_MAP.get(output_format)
+        if output_ext:
+            return output_ext
+        logging.error(
+            "Invalid output format. Please enter a valid output format (note: formats do not include the '.' ."
+        )
 
 
 def _prompt_user_for_format() -> str:
@@ -51,16 +54,6 @@ def _prompt_user_for_format() -> str:
     return output_format
 
 
-def _check_format_return_extension(output_format: str) -> str | None:
-    if output_format in ALIAS_TO_EXTENSION_MAP:
-        output_ext = ALIAS_TO_EXTENSION_MAP[output_format]
-        return output_ext
-    else:
-        logging.error(
-            "Invalid output format. Please enter a valid output format (note: formats do not include the '.' ."
-        )
-
-
 def _offer_chance_to_change_input_ext(
     input_ext: str, output_ext: str, settings: Settings
 ) -> None:
@@ -70,9 +63,12 @@ def _offer_chance_to_change_input_ext(
         method = "user-provided"
 
         logging.error(
-            f"""Conflict detected:\n
-            Output extension '{output_ext}' is the same as the {method} input extension '{input_ext}'.\n
-            Would you like to change the from the detected input format?"""
+            """Conflict detected:\n
+            Output extension '%s' is the same as the %s input extension '%s'.\n
+            Would you like to change the from the detected input format?""",
+            output_ext,
+            method,
+            input_ext,
         )
         # Wishes to change from detected input extension.
         if _yes_no_bool():
@@ -102,7 +98,7 @@ def prompt_for_input_extension(settings: Settings):
     """
     input_ext: str = _get_extension()
     settings.set_input_ext(input_ext, "supplied")
-    logging.info(f"Input extension set to: {input_ext}")
+    logging.info("Input extension set to: %s", input_ext)
 
 
 def get_delimiter(
@@ -180,9 +176,5 @@ def prompt_excel_options(file: Path):
 #     Set TXT-specific options from args or user prompts.
 #     """
 #     # For TXT output, if no delimiter provided, prompt for it.
-#     delimiter = args.delimiter
-#     if delimiter is None:
-#         delimiter = prompt_for_txt_delimiter()
-#
-#     txt_kwargs = prompt_for_txt_delimiter()
-#     args.delimiter = txt_kwargs["delimiter"]
+#     if args.delimiter is None:
+#         args.delimiter = prompt_for_txt_delimiter()["delimiter"]
@@ -3,21 +3,22 @@
 Module for managing application settings and configuration.
 
 This module contains the Settings class, which is responsible for managing and storing information about the files being processed, the input/output extensions, and other settings.
-Additionally, the InputOutputFlags class is used to manage flags related to how the input/output extensions are determined (e.g., from CLI arguments, auto-detected, or prompted).
 """
 
 import logging
+import sys
 
 from Make_It_Parquet.extension_mapping import ALLOWED_FILE_EXTENSIONS
 from Make_It_Parquet.file_information import (
+    EMPTY_FILE_INFO,
     FileInfo,
-    create_file_info,
+    create_file_info_from_path,
 )
 from .cli_parser import (
     CLIArgs,
     get_input_output_extensions,
 )
-from .logger import Logger
+from .logger import Logger, get_logger
 
 
 class Settings:
@@ -25,6 +26,15 @@ class Settings:
     Settings class for managing application configuration.
     """
 
+    __slots__ = (
+        "args",
+        "detected_input_ext",
+        "file_info",
+        "logger",
+        "supplied_input_ext",
+        "supplied_output_ext",
+    )
+
     def __init__(self, args: CLIArgs) -> None:
         """
         Initialize the Settings object.
@@ -32,7 +42,7 @@ class Settings:
         # CLI arguments.
         self.args: CLIArgs = args
         # Logger.
-        self.logger: Logger = Logger(self.args.log_level)
+        self.logger: Logger = get_logger(self.args.log_level)
 
         # get input and output extensions from CLI arguments (if provided).
         self.supplied_input_ext: str | None
@@ -43,8 +53,11 @@ class Settings:
         self.detected_input_ext: str | None = None
 
         # File information.
-        if self.args.input_path:
-            self.file_info: FileInfo = create_file_info(self.args.input_path)
+        self.file_info: FileInfo = (
+            create_file_info_from_path(self.args.input_path)
+            if self.args.input_path
+            else EMPTY_FILE_INFO
+        )
 
         # # Initialise attributes for additional settings.
         # self.excel_settings = None
@@ -56,7 +69,8 @@ class Settings:
 
         Args:
             message: Error message to log
-            error_type: Type of error ('error' or 'exception')
+            error_type: Type of error ('error' or 'exception'). Exits with status 1 for
+                errors, 0 otherwise.
         """
         message = f"{message} Exiting program."
         if error_type == "error":
@@ -66,8 +80,9 @@ class Settings:
         else:
             self.logger.info(message)
 
-        self.logger.stop_logging()
-        exit(1)  # TODO: look at deleting any converted files etc. if needed.
+        # Buffered log records are written by the logger's atexit hook during shutdown.
+        # TODO: look at deleting any converted files etc. if needed.
+        sys.exit(1 if error_type in ("error", "exception") else 0)
 
     def set_input_ext(self, input_ext: str, method: str) -> None:
         if input_ext in ALLOWED_FILE_EXTENSIONS:
@@ -88,21 +103,21 @@ class Settings:
 
     @property
     def master_input_ext(self) -> str | None:
-        if self.supplied_input_ext and not self.detected_input_ext:
-            return self.supplied_input_ext
-        elif self.detected_input_ext and not self.supplied_input_ext:
-            return self.detected_input_ext
-        elif not self.supplied_input_ext and not self.detected_input_ext:
-            return None
-        elif self.supplied_input_ext and self.detected_input_ext:
-            if self.supplied_input_ext == self.detected_input_ext:
-                return self.supplied_input_ext
-            elif self.supplied_input_ext != self.detected_input_ext:
-                self.exit_program(
-                    f"Conflict between detected input extension: '{
-                        self.detected_input_ext
-                    }' and supplied input extension: '{self.supplied_output_ext}'."
-                )
+        """The supplied input extension, else the detected one. Exits if the two conflict."""
+        supplied_input_ext = self.supplied_input_ext
+        detected_input_ext = self.detected_input_ext
+        if (
+            supplied_input_ext
+            and detected_input_ext
+            and supplied_input_ext != detected_input_ext
+        ):
+            self.exit_program(
+                f"Conflict between detected input extension: '{
+                    detected_input_ext
+                }' and supplied input extension: '{supplied_input_ext}'.",
+                error_type="error",
+            )
+        return supplied_input_ext or detected_input_ext
 
     @property
     def master_output_ext(self) -> str | None:
@@ -8,37 +8,15 @@
 Make-it-Parquet!: A data file conversion tool powered by DuckDB.
 """
 
-import threading
-
-from Make_It_Parquet.conversion_manager import ConversionManager
-from Make_It_Parquet.file_manager import DirectoryManager, FileManager
+from Make_It_Parquet.file_manager import create_file_manager
 from Make_It_Parquet.user_interface.cli_parser import CLIArgs, parse_cli_arguments
 from Make_It_Parquet.user_interface.settings import Settings
 
 
-def create_file_manager(
-    settings: Settings,
-) -> FileManager | DirectoryManager:
-    """
-    Determines the appropriate conversion manager (file or directory) depending on
-    the input provided via the settings object.
-
-    Args:
-        settings (Settings): The application settings and configuration.
-
-    Returns:
-        FileManager or DirectoryManager: Instance corresponding to the target type.
-    """
-    if settings.file_info.file_or_directory == "file":
-        return FileManager(settings)
-    else:
-        return DirectoryManager(settings)
-
-
 def main() -> None:
     """
     Initializes the application settings, creates the file manager and conversion manager,
-    and runs export preparation and conversion concurrently.
+    and runs export preparation and conversion concurrently on a thread pool.
     """
     # Parse CLI arguments and initialize settings.
     args: CLIArgs = parse_cli_arguments()
@@ -48,26 +26,29 @@ def main() -> None:
     file_manager = create_file_manager(settings)
     file_manager.get_conversion_list()
 
-    # Initialize the ConversionManager.
-    conversion_manager = ConversionManager(file_manager)
+    # Imported once there are files to convert, so --help and early exits don't load DuckDB.
+    from concurrent.futures import ThreadPoolExecutor
 
-    # Create threads for export preparation and conversion processing.
-    thread_prepare = threading.Thread(
-        target=conversion_manager.prepare_for_export, name="PrepareExportThread"
-    )
-    thread_run = threading.Thread(
-        target=conversion_manager.run_conversion, name="RunConversionThread"
+    from Make_It_Parquet.conversion_manager import (
+        MAX_CONVERSION_WORKERS,
+        ConversionManager,
     )
 
-    # Start both threads.
-    thread_prepare.start()
-    thread_run.start()
-
-    # Wait for both threads to complete.
-    thread_prepare.join()
-    thread_run.join()
+    # Initialize the ConversionManager.
+    conversion_manager = ConversionManager(file_manager)
 
-    # Clean up and exit.
+    # Run export preparation and conversion concurrently on a shared pool.
+    with ThreadPoolExecutor(
+        max_workers=MAX_CONVERSION_WORKERS, thread_name_prefix="MakeItParquet"
+    ) as executor:
+        # Submitted first, as it may need to prompt for the output format.
+        prepare_export = executor.submit(conversion_manager.prepare_for_export)
+        # Imports files while waiting, then converts files concurrently on the pool.
+        all_converted = conversion_manager.run_conversion(executor, prepare_export)
+
+    # Clean up and exit, with an error status if any file failed to convert.
+    if not all_converted:
+        settings.exit_program("Conversion complete, with errors.", error_type="error")
     settings.exit_program("Conversion complete.")
 
 
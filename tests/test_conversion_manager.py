@@ -0,0 +1,58 @@
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from Make_It_Parquet.conversion_manager import ConversionManager
+from Make_It_Parquet.file_manager import create_file_manager
+from Make_It_Parquet.user_interface.cli_parser import CLIArgs
+from Make_It_Parquet.user_interface.logger import get_logger
+from Make_It_Parquet.user_interface.settings import Settings
+
+
+@pytest.fixture
+def settings_for(monkeypatch):
+    """Build Settings for an input path, with a logger stopped once the test finishes."""
+    # Keep the logger out of atexit, whose hooks run after pytest has closed captured streams.
+    monkeypatch.setattr(atexit, "register", lambda func: func)
+    get_logger.cache_clear()
+    created: list[Settings] = []
+
+    def build(input_path, output_format: str) -> Settings:
+        args = CLIArgs(input_path, None, None, output_format, None, None, "INFO")
+        settings = Settings(args)
+        created.append(settings)
+        return settings
+
+    yield build
+    for settings in created:
+        settings.logger.stop_logging()
+    get_logger.cache_clear()
+
+
+def test_run_conversion_collects_failed_files(tmp_path, settings_for):
+    """Test that one malformed file is reported without stopping the others converting."""
+    input_dir = tmp_path / "data_json"
+    input_dir.mkdir()
+    for number in range(2):
+        _ = (input_dir / f"good_{number}.json").write_text(f'{{"a": {number}}}\n')
+    bad_file = input_dir / "bad.json"
+    _ = bad_file.write_text('{"a": 1}\n{"a": \n')
+
+    file_manager = create_file_manager(settings_for(input_dir, "parquet"))
+    file_manager.get_conversion_list()
+    conversion_manager = ConversionManager(file_manager)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        prepare_export = executor.submit(conversion_manager.prepare_for_export)
+        all_converted = conversion_manager.run_conversion(executor, prepare_export)
+
+    assert all_converted is False
+    assert [file_path for file_path, _ in conversion_manager.conversion_errors] == [
+        bad_file.resolve()
+    ]
+    output_dir = tmp_path / "data_parquet"
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        "good_0.parquet",
+        "good_1.parquet",
+    ]
@@ -0,0 +1,113 @@
+from pathlib import Path
+
+import pytest
+
+from Make_It_Parquet import __version__
+from Make_It_Parquet.user_interface.cli_parser import (
+    CLIArgs,
+    _build_parser,
+    _parse_common_arguments,
+    parse_cli_arguments,
+)
+
+
+def full_parse(argv: list[str]) -> CLIArgs:
+    """Parse argv with the full argparse parser, seeded as parse_cli_arguments does."""
+    args = CLIArgs(None, None, None, None, None, None, "INFO")
+    return _build_parser().parse_args(argv, namespace=args)
+
+
+###--- test _parse_common_arguments ---###
+
+
+# Argument lists the fast path handles itself.
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["data/input.csv"],
+        ["data/input.csv", "-o", "parquet"],
+        ["-o", "parquet", "data/input.csv"],
+        ["-i", "csv", "data/input.csv", "-o", "pq"],
+        ["data/input.csv", "--output_format", "json", "--input_format", "csv"],
+        ["data/input.csv", "-op", "out/data.parquet"],
+        ["data/input.csv", "-es", "Sheet1", "-er", "A1:B10"],
+        ["--log-level", "DEBUG", "data/input.csv"],
+        # Repeated options keep the last value, as argparse does.
+        ["data/input.csv", "-o", "csv", "-o", "json"],
+    ],
+)
+def test_fast_path_matches_full_parser(argv):
+    fast_path_args = _parse_common_arguments(argv)
+    assert fast_path_args is not None
+    assert fast_path_args == full_parse(argv)
+
+
+# Argument lists left to the full parser, which parses them.
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["data/input.csv", "--output_format=json"],
+        ["data/input.csv", "--log-level=DEBUG"],
+        ["data/input.csv", "-ojson"],
+    ],
+)
+def test_fast_path_defers_to_full_parser(argv):
+    assert _parse_common_arguments(argv) is None
+    assert full_parse(argv).input_path == Path("data/input.csv")
+
+
+# Argument lists left to the full parser, which rejects them or exits.
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["data/input.csv", "-o"],
+        ["data/input.csv", "-o", "-i"],
+        ["-o", "parquet"],
+        ["data/input.csv", "data/other.csv"],
+        ["data/input.csv", "--unknown"],
+        ["-h"],
+        ["data/input.csv", "--help"],
+        ["--version"],
+    ],
+)
+def test_fast_path_defers_exits_to_full_parser(argv, capsys):
+    assert _parse_common_arguments(argv) is None
+    with pytest.raises(SystemExit):
+        full_parse(argv)
+
+
+###--- test parse_cli_arguments ---###
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["data/input.csv"],
+        ["-o", "parquet", "data/input.csv", "--log-level", "DEBUG"],
+        ["data/input.csv", "--output_format=json"],
+    ],
+)
+def test_parse_cli_arguments_argv(argv):
+    assert parse_cli_arguments(argv) == full_parse(argv)
+
+
+def test_parse_cli_arguments_version(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        parse_cli_arguments(["--version"])
+    assert exit_info.value.code == 0
+    assert capsys.readouterr().out.strip().endswith(__version__)
+
+
+@pytest.mark.parametrize(
+    "argv, exit_code",
+    [
+        (["-h"], 0),
+        (["data/input.csv", "-o"], 2),
+        (["data/input.csv", "data/other.csv"], 2),
+    ],
+)
+def test_parse_cli_arguments_exits(argv, exit_code, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        parse_cli_arguments(argv)
+    assert exit_info.value.code == exit_code
@@ -1,9 +1,30 @@
+import atexit
+import io
 import logging
-import time
 
+import pytest
 
 # Adjust this import if your Logger class is in another module file.
-from Make_It_Parquet.user_interface.logger import Logger
+from Make_It_Parquet.user_interface.logger import BufferedConsoleHandler, Logger
+
+
+@pytest.fixture(autouse=True)
+def skip_atexit_registration(monkeypatch):
+    """Keep test loggers out of atexit, whose hooks run after pytest has closed captured streams."""
+    monkeypatch.setattr(atexit, "register", lambda func: func)
+
+
+def make_buffered_handler() -> tuple[BufferedConsoleHandler, io.StringIO]:
+    """Create a BufferedConsoleHandler writing to an in-memory stream."""
+    stream = io.StringIO()
+    handler = BufferedConsoleHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler, stream
+
+
+def log(handler: logging.Handler, message: str, *args: object) -> None:
+    """Pass a record straight to the handler, as a logger would."""
+    _ = handler.handle(logging.makeLogRecord({"msg": message, "args": args}))
 
 
 def test_logger_creation_valid_level():
@@ -12,21 +33,19 @@ def test_logger_creation_valid_level():
 
     # Check that active_log_level is set correctly.
     assert test_logger.active_log_level == logging.DEBUG
-    # Check that the underlying logger's level is set.
-    assert test_logger.logger.level == logging.DEBUG
-
-    # Check that the helper components are created.
-    assert test_logger.console_handler is not None
-    assert test_logger.queue_handler is not None
-    assert test_logger.queue_listener is not None
+    # Check that the logger's level is set.
+    assert test_logger.level == logging.DEBUG
 
-    # Check that the queue handler is attached to the logger.
-    assert test_logger.queue_handler in test_logger.logger.handlers
+    # Check that the buffered console handler is attached to the logger.
+    assert isinstance(test_logger.console_handler, BufferedConsoleHandler)
+    assert test_logger.console_handler in test_logger.handlers
 
     # Verify that the console handler uses the correct formatter.
-    expected_fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    expected_fmt = "%(asctime)s - %(message)s"
     assert test_logger.console_handler.formatter._fmt == expected_fmt
 
+    test_logger.stop_logging()
+
 
 def test_logger_creation_invalid_level():
     """Test that an invalid log level defaults to INFO."""
@@ -34,34 +53,93 @@ def test_logger_creation_invalid_level():
 
     # Should default to INFO.
     assert test_logger.active_log_level == logging.INFO
-    assert test_logger.logger.level == logging.INFO
+    assert test_logger.level == logging.INFO
 
+    test_logger.stop_logging()
 
-def test_stop_logging_and_queue_empty():
-    """Test that stop_logging processes all queued log records and empties the queue."""
-    test_logger = Logger("INFO")
 
-    # Log some messages.
-    test_logger.logger.info("Test message 1")
-    test_logger.logger.warning("Test message 2")
+def test_logger_above_info_writes_directly():
+    """Test that levels above INFO use a plain StreamHandler rather than a writer thread."""
+    test_logger = Logger("WARNING")
 
-    # Allow a brief moment for the asynchronous logging to enqueue the messages.
-    time.sleep(0.1)
+    assert type(test_logger.console_handler) is logging.StreamHandler
+    assert test_logger.console_handler in test_logger.handlers
 
-    # Stop logging.
+    # Stopping flushes the stream handler without raising.
     test_logger.stop_logging()
 
-    # Optionally wait a moment to ensure the listener finished processing.
-    time.sleep(0.1)
 
-    # After stopping, the log queue should be empty.
-    assert test_logger.log_queue.empty()
+def test_writer_thread_started_on_first_emit():
+    """Test that the writer thread is only started once a record is emitted."""
+    handler, _ = make_buffered_handler()
+
+    assert not handler.started
+    assert not handler.writer_thread.is_alive()
+
+    log(handler, "First message")
+    assert handler.started
+
+    handler.stop()
+
+
+def test_stop_drains_buffered_records():
+    """Test that stop writes every buffered record before the writer thread exits."""
+    handler, stream = make_buffered_handler()
+
+    # Log some messages.
+    for number in range(100):
+        log(handler, "Test message %d", number)
+
+    # Stop logging.
+    handler.stop()
+
+    # All records are written, in order, and nothing is left buffered.
+    assert stream.getvalue().splitlines() == [
+        f"Test message {number}" for number in range(100)
+    ]
+    assert not handler.buffer
+    assert not handler.writer_thread.is_alive()
+
+
+def test_stop_multiple_calls():
+    """Ensure calling stop more than once doesn't raise an exception."""
+    handler, stream = make_buffered_handler()
+    log(handler, "Another test message")
+
+    # Call stop twice.
+    handler.stop()
+    # Second call should not raise an exception.
+    handler.stop()
+
+    assert stream.getvalue() == "Another test message\n"
+
+
+def test_stop_before_first_emit():
+    """Ensure stop doesn't raise if the writer thread was never started."""
+    handler, stream = make_buffered_handler()
+
+    handler.stop()
+
+    assert not handler.started
+    assert stream.getvalue() == ""
+
+
+def test_emit_after_stop_writes_directly():
+    """Test that records emitted after stop are written straight to the stream."""
+    handler, stream = make_buffered_handler()
+    log(handler, "Before stop")
+    handler.stop()
+
+    log(handler, "After stop")
+
+    assert stream.getvalue() == "Before stop\nAfter stop\n"
+    assert not handler.buffer
 
 
 def test_stop_logging_multiple_calls():
     """Ensure calling stop_logging more than once doesn't raise an exception."""
     test_logger = Logger("DEBUG")
-    test_logger.logger.info("Another test message")
+    test_logger.info("Another test message")
 
     # Call stop_logging twice.
     test_logger.stop_logging()